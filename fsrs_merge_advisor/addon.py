@@ -9,6 +9,7 @@ from typing import Any, Callable
 from aqt import mw
 from aqt.qt import (
     QAbstractItemView,
+    QAbstractTableModel,
     QAction,
     QColor,
     QComboBox,
@@ -20,10 +21,12 @@ from aqt.qt import (
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QModelIndex,
     QProgressDialog,
     QPushButton,
     QScrollArea,
     QSlider,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     Qt,
@@ -38,6 +41,7 @@ from .analyzer import (
     extract_fsrs_weights,
     is_fsrs6_valid_params,
     pairwise_distance_matrix,
+    sort_profiles_by_name,
 )
 from .infra.decks_gateway import (
     all_preset_configs as _all_preset_configs,
@@ -50,6 +54,7 @@ from .infra.decks_gateway import (
     deck_entries as _deck_entries,
     field as _field,
     field_any as _field_any,
+    invalidate_listing_cache as _invalidate_listing_cache,
 )
 from .tools.cache import can_reuse_cached_params
 from .tools.deck_scope import descendant_deck_ids, leaf_deck_entries
@@ -58,13 +63,15 @@ from .tools.grouping import (
     max_distance_to_group_for_item,
     max_pairwise_distance_for_group,
     recommended_group_preset_name,
-    similar_items_below_threshold,
+    similar_items_by_row,
     similarity_groups_from_matrix,
 )
+from .tools.matrix_display import distance_cell_display_text
 from .tools.progress_messages import (
     optimization_progress_message,
     preset_optimization_progress_message,
 )
+from .tools.progress_throttle import ProgressThrottle
 from .tools.relearning import count_relearning_steps_in_day
 from .tools.search_queries import build_deck_search_query, build_multi_deck_search_query
 from .use_cases.preset_reoptimization import (
@@ -99,6 +106,20 @@ _CLEAN_EMPTY_PRESETS_LABEL = "FSRS Cleanup Empty Advisor Presets"
 _CACHE_FILE_NAME = "deck_params_cache.json"
 _PRESET_BACKUP_FILE_NAME = "deck_preset_backup.json"
 _EVALUATE_LOGLOSS_CACHE_FILE_NAME = "evaluate_logloss_cache.json"
+# Rows sampled per column when sizing distance matrix columns to their contents.
+_DISTANCE_MATRIX_RESIZE_SAMPLE_ROWS = 50
+
+# Index of the call shape that last worked for each API probe ladder, so later
+# calls try it first instead of failing through the older shapes again.
+_accepted_call_patterns: dict[str, int] = {}
+
+
+def _with_accepted_first(kind: str, candidates: Sequence[Any]) -> list[tuple[int, Any]]:
+    indexed = list(enumerate(candidates))
+    accepted = _accepted_call_patterns.get(kind)
+    if accepted is None or not 0 <= accepted < len(indexed):
+        return indexed
+    return [indexed[accepted]] + indexed[:accepted] + indexed[accepted + 1 :]
 
 
 class _PaneScopedListWidget(QListWidget):
@@ -131,6 +152,70 @@ class _PaneScopedListWidget(QListWidget):
         else:
             event.ignore()
 
+
+class _DistanceMatrixModel(QAbstractTableModel):
+    """Formats matrix cells on demand instead of building a QTableWidgetItem per cell."""
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        distances: Sequence[Sequence[float | None]],
+        valid: Sequence[bool],
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._labels = list(labels)
+        self._distances = distances
+        self._valid = list(valid)
+        item_data_role = getattr(Qt, "ItemDataRole", None)
+        display_role = item_data_role.DisplayRole if item_data_role is not None else Qt.DisplayRole
+        # PyQt6 may hand roles over as plain ints, so compare underlying values.
+        self._display_role = getattr(display_role, "value", display_role)
+
+    def _is_display_role(self, role: Any) -> bool:
+        return role is None or getattr(role, "value", role) == self._display_role
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._labels)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._labels)
+
+    def data(self, index: QModelIndex, role: Any = None) -> Any:
+        if not index.isValid() or not self._is_display_role(role):
+            return None
+        row, col = index.row(), index.column()
+        return distance_cell_display_text(
+            self._distances[row][col],
+            row_valid=self._valid[row],
+            col_valid=self._valid[col],
+        )
+
+    def headerData(self, section: int, orientation: Any, role: Any = None) -> Any:
+        if not self._is_display_role(role) or section < 0 or section >= len(self._labels):
+            return None
+        return self._labels[section]
+
+
+def _distance_matrix_view(
+    labels: Sequence[str],
+    distances: Sequence[Sequence[float | None]],
+    valid: Sequence[bool],
+    parent: QWidget,
+) -> QTableView:
+    view = QTableView(parent)
+    view.setModel(_DistanceMatrixModel(labels, distances, valid, view))
+    # Size columns from the header plus a bounded sample of rows; Qt's default
+    # precision formats up to 1000 rows per column before the view is shown.
+    view.horizontalHeader().setResizeContentsPrecision(_DISTANCE_MATRIX_RESIZE_SAMPLE_ROWS)
+    view.resizeColumnsToContents()
+    return view
+
+
 def _legacy_cache_file_path() -> Path:
     return Path(__file__).resolve().parent / _CACHE_FILE_NAME
 
@@ -314,12 +399,28 @@ def _cache_key(deck_id: int, *, include_children: bool) -> str:
     return f"{scope}:{deck_id}"
 
 
+def _review_counts_by_deck_id() -> dict[int, int]:
+    sql = (
+        "SELECT c.did, COUNT(*) "
+        "FROM revlog r "
+        "JOIN cards c ON c.id = r.cid "
+        "GROUP BY c.did"
+    )
+    counts: dict[int, int] = {}
+    for raw_deck_id, raw_count in mw.col.db.all(sql):
+        deck_id = _as_int(raw_deck_id)
+        if deck_id is not None:
+            counts[deck_id] = int(raw_count or 0)
+    return counts
+
+
 def _review_count_for_deck_scope(
     *,
     deck_id: int,
     deck_name: str,
     include_children: bool,
     entries: Sequence[tuple[int, str]],
+    review_counts_by_deck: Mapping[int, int] | None = None,
 ) -> int:
     scope_ids = (
         descendant_deck_ids(entries, deck_name)
@@ -328,6 +429,8 @@ def _review_count_for_deck_scope(
     )
     if not scope_ids:
         return 0
+    if review_counts_by_deck is not None:
+        return sum(review_counts_by_deck.get(int(did), 0) for did in scope_ids)
     placeholders = ",".join("?" for _ in scope_ids)
     sql = (
         "SELECT COUNT(*) "
@@ -375,7 +478,7 @@ def _ensure_deck_id_for_name(deck_name: str) -> int | None:
         ("idForName", (deck_name,), {}),
         ("add_normal_deck_with_name", (deck_name,), {}),
     ]
-    for method_name, args, kwargs in candidates:
+    for pattern_idx, (method_name, args, kwargs) in _with_accepted_first("create_deck", candidates):
         method = getattr(deck_manager, method_name, None)
         if method is None:
             continue
@@ -383,8 +486,10 @@ def _ensure_deck_id_for_name(deck_name: str) -> int | None:
             created = method(*args, **kwargs)
         except Exception:
             continue
+        _invalidate_listing_cache()
         deck_id = _as_positive_int(created)
         if deck_id is not None:
+            _accepted_call_patterns["create_deck"] = pattern_idx
             return deck_id
 
     return _deck_id_for_name(deck_name)
@@ -466,6 +571,7 @@ def _delete_deck_by_id(deck_id: int) -> bool:
             method(*args, **kwargs)
         except Exception:
             continue
+        _invalidate_listing_cache()
         if not _deck_exists(int(deck_id)):
             return True
 
@@ -502,6 +608,7 @@ def _delete_preset_by_id(conf_id: int) -> bool:
             method(*args, **kwargs)
         except Exception:
             continue
+        _invalidate_listing_cache()
         if not _preset_exists():
             return True
 
@@ -524,12 +631,13 @@ def _move_cards_to_deck(
             ((), {"cids": list(normalized), "did": int(target_deck_id)}),
             ((), {"card_ids": list(normalized), "deck_id": int(target_deck_id)}),
         ]
-        for args, kwargs in call_patterns:
+        for pattern_idx, (args, kwargs) in _with_accepted_first("set_deck", call_patterns):
             try:
                 if kwargs:
                     set_deck(**kwargs)
                 else:
                     set_deck(*args)
+                _accepted_call_patterns["set_deck"] = pattern_idx
                 return len(normalized), 0
             except Exception:
                 continue
@@ -581,7 +689,7 @@ def _load_profiles() -> list[FSRSProfile]:
         if weights is None:
             continue
 
-        profiles.append(FSRSProfile(profile_id=conf_id, profile_name=conf_name, weights=weights))
+        profiles.append(FSRSProfile.build(profile_id=conf_id, profile_name=conf_name, weights=weights))
 
     return profiles
 
@@ -590,7 +698,7 @@ def _to_float_sequence(value: Any) -> tuple[float, ...] | None:
     if not isinstance(value, Sequence) or isinstance(value, (str, bytes, bytearray)):
         return None
     try:
-        return tuple(float(item) for item in value)
+        return tuple(map(float, value))
     except (TypeError, ValueError):
         return None
 
@@ -615,8 +723,7 @@ def _extract_relearning_steps(config: Any) -> tuple[float, ...]:
     return ()
 
 
-def _num_relearning_steps_in_day_for_deck(deck_id: int) -> int:
-    config = _config_for_deck(deck_id)
+def _num_relearning_steps_in_day_for_config(config: Any) -> int:
     steps = _extract_relearning_steps(config)
     return count_relearning_steps_in_day(steps)
 
@@ -654,9 +761,10 @@ def _compute_fsrs_params_for_deck(
 
     response = None
     last_type_error: Exception | None = None
-    for kwargs in candidates:
+    for pattern_idx, kwargs in _with_accepted_first("compute_fsrs_params", candidates):
         try:
             response = compute(**kwargs)
+            _accepted_call_patterns["compute_fsrs_params"] = pattern_idx
             break
         except TypeError as exc:
             last_type_error = exc
@@ -701,9 +809,10 @@ def _evaluate_logloss_with_params(
 
     response = None
     last_type_error: Exception | None = None
-    for kwargs in candidates:
+    for pattern_idx, kwargs in _with_accepted_first("evaluate_params", candidates):
         try:
             response = evaluate(**kwargs)
+            _accepted_call_patterns["evaluate_params"] = pattern_idx
             break
         except TypeError as exc:
             last_type_error = exc
@@ -742,7 +851,11 @@ def _optimize_preset_configs(
     cancelled = False
     processed = 0
 
+    throttle = ProgressThrottle()
+
     def _set_progress(done: int, preset_name: str | None) -> None:
+        if not throttle.due(done, total, preset_name):
+            return
         progress.setMaximum(max(total, 0))
         progress.setValue(min(done, total))
         progress.setLabelText(
@@ -755,7 +868,6 @@ def _optimize_preset_configs(
         progress.show()
         progress.repaint()
         mw.app.processEvents()
-        progress.repaint()
 
     try:
         _set_progress(0, None)
@@ -820,6 +932,7 @@ def _optimize_preset_configs(
                     params=params,
                 )
                 update_config(payload)
+                _invalidate_listing_cache()
                 optimized += 1
             except Exception:
                 failed += 1
@@ -841,12 +954,16 @@ def _optimize_preset_configs(
 def _load_computed_deck_profiles(
     *,
     include_middle_and_root: bool,
-    progress_callback: Callable[[int, int, str | None], bool] | None = None,
+    # Called as (done, total, deck_name, cached); cached is True when the deck's
+    # params come from the params cache and no optimization will run.
+    progress_callback: Callable[[int, int, str | None, bool], bool] | None = None,
 ) -> tuple[list[FSRSProfile], list[str], list[str], list[str], bool]:
     entries = sorted(_deck_entries(), key=lambda item: item[1].lower())
     selected_entries = entries if include_middle_and_root else leaf_deck_entries(entries)
     cache = _load_deck_param_cache()
     cache_dirty = False
+    # One grouped query instead of a revlog scan per deck.
+    review_counts_by_deck = _review_counts_by_deck_id()
 
     profiles: list[FSRSProfile] = []
     no_data_decks: list[str] = []
@@ -854,28 +971,35 @@ def _load_computed_deck_profiles(
     failed_decks: list[str] = []
     total = len(selected_entries)
     processed = 0
+    # Decks sharing a preset share its weights and relearning steps.
+    preset_inputs: dict[int, tuple[tuple[float, ...], int]] = {}
 
     def _save_cache_if_needed() -> None:
         if cache_dirty:
             _save_deck_param_cache(cache)
 
-    if progress_callback is not None and not progress_callback(0, total, None):
+    if progress_callback is not None and not progress_callback(0, total, None, False):
         _save_cache_if_needed()
         return profiles, no_data_decks, invalid_param_decks, failed_decks, True
 
     for deck_id, deck_name in selected_entries:
-        if progress_callback is not None and not progress_callback(processed, total, deck_name):
-            _save_cache_if_needed()
-            return profiles, no_data_decks, invalid_param_decks, failed_decks, True
-
         config = _config_for_deck(deck_id)
-        current_params = extract_fsrs_weights(config) or ()
-        num_of_relearning_steps = _num_relearning_steps_in_day_for_deck(deck_id)
+        conf_id = _as_int(_field(config, "id"))
+        inputs = preset_inputs.get(conf_id) if conf_id is not None else None
+        if inputs is None:
+            inputs = (
+                extract_fsrs_weights(config) or (),
+                _num_relearning_steps_in_day_for_config(config),
+            )
+            if conf_id is not None:
+                preset_inputs[conf_id] = inputs
+        current_params, num_of_relearning_steps = inputs
         review_count = _review_count_for_deck_scope(
             deck_id=deck_id,
             deck_name=deck_name,
             include_children=include_middle_and_root,
             entries=entries,
+            review_counts_by_deck=review_counts_by_deck,
         )
         search = build_deck_search_query(
             deck_id=deck_id,
@@ -888,11 +1012,18 @@ def _load_computed_deck_profiles(
         cached_params = _to_float_sequence(cached_entry.get("params"))
         cached_fsrs_items = _as_int(cached_entry.get("fsrs_items")) or 0
 
-        if can_reuse_cached_params(
+        reuse_cached = can_reuse_cached_params(
             cached_review_count=cached_review_count,
             current_review_count=review_count,
             cached_params=cached_params,
+        )
+        if progress_callback is not None and not progress_callback(
+            processed, total, deck_name, reuse_cached
         ):
+            _save_cache_if_needed()
+            return profiles, no_data_decks, invalid_param_decks, failed_decks, True
+
+        if reuse_cached:
             params = cached_params
             fsrs_items = cached_fsrs_items
         else:
@@ -922,17 +1053,30 @@ def _load_computed_deck_profiles(
             processed += 1
             continue
 
-        profiles.append(FSRSProfile(profile_id=deck_id, profile_name=deck_name, weights=params))
+        profiles.append(FSRSProfile.build(profile_id=deck_id, profile_name=deck_name, weights=params))
         processed += 1
 
     _save_cache_if_needed()
-    if progress_callback is not None and not progress_callback(processed, total, None):
+    if progress_callback is not None and not progress_callback(processed, total, None, False):
         return profiles, no_data_decks, invalid_param_decks, failed_decks, True
     return profiles, no_data_decks, invalid_param_decks, failed_decks, False
 
 
 def _params_to_str(weights: tuple[float, ...]) -> str:
-    return ", ".join(f"{w:.4f}" for w in weights)
+    return ", ".join(map("{:.4f}".format, weights))
+
+
+def _suspend_table_updates(table: QTableWidget) -> None:
+    # Avoid a relayout/repaint per setItem while a table is being filled.
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    table.blockSignals(True)
+
+
+def _resume_table_updates(table: QTableWidget) -> None:
+    table.blockSignals(False)
+    table.setUpdatesEnabled(True)
+    table.resizeColumnsToContents()
 
 
 def _show_pairwise_distances(
@@ -941,36 +1085,22 @@ def _show_pairwise_distances(
     title: str,
     empty_message: str,
 ) -> None:
-    ordered_profiles, distances = pairwise_distance_matrix(profiles)
-    if not ordered_profiles:
+    if not profiles:
         showInfo(empty_message)
         return
+    if len(profiles) == 1:
+        showInfo("Only one profile with FSRS parameters; there are no pairwise distances to show.")
+        return
+
+    ordered_profiles, distances = pairwise_distance_matrix(profiles)
 
     dialog = QDialog(mw)
     dialog.setWindowTitle(f"{title} - All Distances")
     layout = QVBoxLayout(dialog)
 
-    table = QTableWidget(len(ordered_profiles), len(ordered_profiles), dialog)
     labels = [profile.profile_name for profile in ordered_profiles]
-    table.setHorizontalHeaderLabels(labels)
-
-    for row_idx, row_profile in enumerate(ordered_profiles):
-        table.setVerticalHeaderItem(row_idx, QTableWidgetItem(row_profile.profile_name))
-        for col_idx in range(len(ordered_profiles)):
-            col_profile = ordered_profiles[col_idx]
-            if not is_fsrs6_valid_params(row_profile.weights) or not is_fsrs6_valid_params(
-                col_profile.weights
-            ):
-                display = "Not FSRS6 valid params"
-                table.setItem(row_idx, col_idx, QTableWidgetItem(display))
-                continue
-
-            value = distances[row_idx][col_idx]
-            display = "-" if value is None else f"{value:.4f}"
-            table.setItem(row_idx, col_idx, QTableWidgetItem(display))
-
-    table.resizeColumnsToContents()
-    layout.addWidget(table)
+    valid = [is_fsrs6_valid_params(profile.weights) for profile in ordered_profiles]
+    layout.addWidget(_distance_matrix_view(labels, distances, valid, dialog))
 
     dialog.resize(1200, 700)
     dialog.exec()
@@ -987,12 +1117,15 @@ def _show_results_for_profiles(
     similarity_deck_ids: Sequence[int] | None = None,
     similarity_distances: Sequence[Sequence[float | None]] | None = None,
     preset_groups: Sequence[tuple[int, str, Sequence[int]]] | None = None,
+    distance_matrix: tuple[list[FSRSProfile], list[list[float | None]]] | None = None,
 ) -> None:
     if not profiles:
         showWarning(f"No FSRS parameters were found on existing {item_label.lower()}s.")
         return
 
-    results = analyze_profiles(profiles)
+    if distance_matrix is None:
+        distance_matrix = pairwise_distance_matrix(profiles)
+    results = analyze_profiles(profiles, distance_matrix=distance_matrix)
     if not results:
         showInfo("Nothing to display.")
         return
@@ -1013,7 +1146,8 @@ def _show_results_for_profiles(
         ]
     )
 
-    for row, result in enumerate(results):
+    row_values: list[tuple[str, ...]] = []
+    for result in results:
         if result.status_message:
             similar_or_nearest = "-"
             nearest_distance = result.status_message
@@ -1031,35 +1165,31 @@ def _show_results_for_profiles(
             else:
                 share_preset = "Yes" if result.should_share_preset else "No"
 
-        table.setItem(row, 0, QTableWidgetItem(result.profile.profile_name))
-        table.setItem(row, 1, QTableWidgetItem(_params_to_str(result.profile.weights)))
-        table.setItem(row, 2, QTableWidgetItem(similar_or_nearest))
-        table.setItem(row, 3, QTableWidgetItem(nearest_distance))
-        table.setItem(row, 4, QTableWidgetItem(share_preset))
+        row_values.append(
+            (
+                result.profile.profile_name,
+                _params_to_str(result.profile.weights),
+                similar_or_nearest,
+                nearest_distance,
+                share_preset,
+            )
+        )
 
-    table.resizeColumnsToContents()
+    _suspend_table_updates(table)
+    set_item = table.setItem
+    for row, values in enumerate(row_values):
+        for col, text in enumerate(values):
+            set_item(row, col, QTableWidgetItem(text))
+    _resume_table_updates(table)
     layout.addWidget(table)
 
     matrix_title = QLabel("Proximity Matrix", dialog)
     layout.addWidget(matrix_title)
 
-    ordered_profiles, distances = pairwise_distance_matrix(profiles)
-    matrix_table = QTableWidget(len(ordered_profiles), len(ordered_profiles), dialog)
+    ordered_profiles, distances = distance_matrix
     matrix_labels = [profile.profile_name for profile in ordered_profiles]
-    matrix_table.setHorizontalHeaderLabels(matrix_labels)
-    for row_idx, row_profile in enumerate(ordered_profiles):
-        matrix_table.setVerticalHeaderItem(row_idx, QTableWidgetItem(row_profile.profile_name))
-        for col_idx, col_profile in enumerate(ordered_profiles):
-            if not is_fsrs6_valid_params(row_profile.weights) or not is_fsrs6_valid_params(
-                col_profile.weights
-            ):
-                display = "Not FSRS6 valid params"
-            else:
-                value = distances[row_idx][col_idx]
-                display = "-" if value is None else f"{value:.4f}"
-            matrix_table.setItem(row_idx, col_idx, QTableWidgetItem(display))
-    matrix_table.resizeColumnsToContents()
-    layout.addWidget(matrix_table)
+    matrix_valid = [is_fsrs6_valid_params(profile.weights) for profile in ordered_profiles]
+    layout.addWidget(_distance_matrix_view(matrix_labels, distances, matrix_valid, dialog))
 
     if (
         similarity_groups is not None
@@ -1658,6 +1788,7 @@ def _show_similarity_groups(
                             else:
                                 cloned["name"] = base_name
                             update_config(cloned)
+                            _invalidate_listing_cache()
                             copied_settings += 1
                     except Exception:
                         settings_copy_failed += 1
@@ -1678,8 +1809,10 @@ def _show_similarity_groups(
                 try:
                     if create_config_id is not None:
                         new_conf_id = int(create_config_id(base_name, clone_from=clone_from))
+                        _invalidate_listing_cache()
                     elif create_config is not None:
                         new_conf = create_config(base_name, clone_from=clone_from)
+                        _invalidate_listing_cache()
                         new_conf_id = _as_int(_field(new_conf, "id"))
                         if new_conf_id is None:
                             raise RuntimeError("Created preset has no id")
@@ -1804,7 +1937,12 @@ def _show_deck_computed_results() -> None:
     progress.setMinimumDuration(0)
     progress.setValue(0)
 
-    def _progress_callback(done: int, total: int, deck_name: str | None) -> bool:
+    throttle = ProgressThrottle()
+
+    def _progress_callback(done: int, total: int, deck_name: str | None, cached: bool) -> bool:
+        # Cached decks are rate-limited; a deck about to be optimized is always shown.
+        if not throttle.due(done, total, None if cached else deck_name):
+            return not progress.wasCanceled()
         progress.setMaximum(max(total, 0))
         progress.setValue(min(done, total))
         progress.setLabelText(
@@ -1813,7 +1951,6 @@ def _show_deck_computed_results() -> None:
         progress.show()
         progress.repaint()
         mw.app.processEvents()
-        progress.repaint()
         return not progress.wasCanceled()
 
     try:
@@ -1877,15 +2014,15 @@ def _show_deck_computed_results() -> None:
         ],
         key=lambda item: item[1].lower(),
     )
-    similar_by_id: dict[int, str] = {}
-    for idx, profile in enumerate(ordered):
-        similar_items = similar_items_below_threshold(
-            names=labels,
-            distances_row=matrix[idx],
-            self_index=idx,
-            threshold=FSRS6_RECENCY_MAHALANOBIS_SHARED_PRESET_THRESHOLD,
-        )
-        similar_by_id[profile.profile_id] = ", ".join(similar_items) if similar_items else "-"
+    similar_rows = similar_items_by_row(
+        names=labels,
+        distances=matrix,
+        threshold=FSRS6_RECENCY_MAHALANOBIS_SHARED_PRESET_THRESHOLD,
+    )
+    similar_by_id: dict[int, str] = {
+        profile.profile_id: ", ".join(similar_items) if similar_items else "-"
+        for profile, similar_items in zip(ordered, similar_rows)
+    }
     similarity_groups = similarity_groups_from_matrix(
         names=labels,
         distances=matrix,
@@ -1904,6 +2041,7 @@ def _show_deck_computed_results() -> None:
             similarity_deck_ids=ordered_deck_ids,
             similarity_distances=matrix,
             preset_groups=preset_groups,
+            distance_matrix=(ordered, matrix),
         )
 
     _show_similarity_groups(
@@ -2019,8 +2157,10 @@ def _split_deck_by_first_review() -> None:
             try:
                 if create_config_id is not None:
                     preset_id = int(create_config_id(preset_name, clone_from=source_config))
+                    _invalidate_listing_cache()
                 elif create_config is not None:
                     new_config = create_config(preset_name, clone_from=source_config)
+                    _invalidate_listing_cache()
                     preset_id = _as_int(_field(new_config, "id"))
                 else:
                     preset_id = None
@@ -2296,7 +2436,12 @@ def _show_mergeability_evaluation() -> None:
     progress.setMinimumDuration(0)
     progress.setValue(0)
 
-    def _progress_callback(done: int, total: int, deck_name: str | None) -> bool:
+    throttle = ProgressThrottle()
+
+    def _progress_callback(done: int, total: int, deck_name: str | None, cached: bool) -> bool:
+        # Cached decks are rate-limited; a deck about to be optimized is always shown.
+        if not throttle.due(done, total, None if cached else deck_name):
+            return not progress.wasCanceled()
         progress.setMaximum(max(total, 0))
         progress.setValue(min(done, total))
         progress.setLabelText(
@@ -2305,7 +2450,6 @@ def _show_mergeability_evaluation() -> None:
         progress.show()
         progress.repaint()
         mw.app.processEvents()
-        progress.repaint()
         return not progress.wasCanceled()
 
     try:
@@ -2337,7 +2481,7 @@ def _show_mergeability_evaluation() -> None:
     if notes:
         showInfo("Deck computation notes:\n" + "\n".join(notes))
 
-    ordered_profiles = sorted(profiles, key=lambda profile: profile.profile_name.lower())
+    ordered_profiles = sort_profiles_by_name(profiles)
     labels = [profile.profile_name for profile in ordered_profiles]
     entries = sorted(_deck_entries(), key=lambda item: item[1].lower())
     searches = [
@@ -2348,12 +2492,14 @@ def _show_mergeability_evaluation() -> None:
         )
         for profile in ordered_profiles
     ]
+    review_counts_by_deck = _review_counts_by_deck_id()
     review_counts = [
         _review_count_for_deck_scope(
             deck_id=profile.profile_id,
             deck_name=profile.profile_name,
             include_children=include_middle_and_root,
             entries=entries,
+            review_counts_by_deck=review_counts_by_deck,
         )
         for profile in ordered_profiles
     ]
@@ -2368,27 +2514,15 @@ def _show_mergeability_evaluation() -> None:
     evaluate_cache = _load_evaluate_logloss_cache()
     evaluate_cache_dirty = False
 
-    losses: list[list[float | None]] = [
-        [None for _ in range(len(ordered_profiles))] for _ in range(len(ordered_profiles))
-    ]
+    profile_count = len(ordered_profiles)
+    losses: list[list[float | None]] = [[None] * profile_count for _ in range(profile_count)]
     eval_failed = 0
     done = 0
     cancelled_eval = False
+    eval_throttle = ProgressThrottle()
     try:
         for target_idx, target_profile in enumerate(ordered_profiles):
             for source_idx, source_profile in enumerate(ordered_profiles):
-                eval_progress.setValue(done)
-                eval_progress.setLabelText(
-                    f'Evaluating "{target_profile.profile_name}" with params from '
-                    f'"{source_profile.profile_name}"\nCompleted: {done}/{total_evals}'
-                )
-                eval_progress.show()
-                eval_progress.repaint()
-                mw.app.processEvents()
-                eval_progress.repaint()
-                if eval_progress.wasCanceled():
-                    cancelled_eval = True
-                    break
                 cache_key = evaluate_logloss_cache_key(
                     target_deck_id=target_profile.profile_id,
                     include_children=include_middle_and_root,
@@ -2397,11 +2531,27 @@ def _show_mergeability_evaluation() -> None:
                 cached_entry = evaluate_cache.get(cache_key, {})
                 cached_review_count = _as_int(cached_entry.get("review_count"))
                 cached_log_loss = _to_float(cached_entry.get("log_loss"))
-                if can_reuse_evaluate_cached_logloss(
+                reuse_cached = can_reuse_evaluate_cached_logloss(
                     cached_review_count=cached_review_count,
                     current_review_count=review_counts[target_idx],
                     cached_log_loss=cached_log_loss,
-                ):
+                )
+                # Cached pairs are rate-limited; a pair about to be evaluated is
+                # always shown so the dialog names the slow step.
+                pair_label = None if reuse_cached else (target_idx, source_idx)
+                if eval_throttle.due(done, total_evals, pair_label):
+                    eval_progress.setValue(done)
+                    eval_progress.setLabelText(
+                        f'Evaluating "{target_profile.profile_name}" with params from '
+                        f'"{source_profile.profile_name}"\nCompleted: {done}/{total_evals}'
+                    )
+                    eval_progress.show()
+                    eval_progress.repaint()
+                    mw.app.processEvents()
+                if eval_progress.wasCanceled():
+                    cancelled_eval = True
+                    break
+                if reuse_cached:
                     losses[target_idx][source_idx] = cached_log_loss
                     done += 1
                     continue
@@ -2436,22 +2586,7 @@ def _show_mergeability_evaluation() -> None:
         showWarning(f"Mergeability evaluation had {eval_failed} failed logloss evaluations.")
 
     score_matrix = symmetric_merge_score_matrix(losses=losses, review_counts=review_counts)
-    maha_ordered_profiles, maha_raw_matrix = pairwise_distance_matrix(ordered_profiles)
-    profile_index_by_id = {
-        profile.profile_id: idx for idx, profile in enumerate(maha_ordered_profiles)
-    }
-    maha_matrix: list[list[float | None]] = [
-        [None for _ in range(len(ordered_profiles))] for _ in range(len(ordered_profiles))
-    ]
-    for row_idx, row_profile in enumerate(ordered_profiles):
-        mapped_row = profile_index_by_id.get(row_profile.profile_id)
-        if mapped_row is None:
-            continue
-        for col_idx, col_profile in enumerate(ordered_profiles):
-            mapped_col = profile_index_by_id.get(col_profile.profile_id)
-            if mapped_col is None:
-                continue
-            maha_matrix[row_idx][col_idx] = maha_raw_matrix[mapped_row][mapped_col]
+    _, maha_matrix = pairwise_distance_matrix(ordered_profiles, presorted=True)
 
     preset_groups_map: dict[int, dict[str, Any]] = {}
     for idx, profile in enumerate(ordered_profiles):
@@ -2676,8 +2811,10 @@ def _show_mergeability_evaluation() -> None:
                 try:
                     if create_config_id is not None:
                         new_conf_id = int(create_config_id(base_name, clone_from=clone_from))
+                        _invalidate_listing_cache()
                     elif create_config is not None:
                         new_conf = create_config(base_name, clone_from=clone_from)
+                        _invalidate_listing_cache()
                         new_conf_id = _as_int(_field(new_conf, "id"))
                         if new_conf_id is None:
                             raise RuntimeError("Created preset has no id")
@@ -2858,27 +2995,37 @@ def _show_mergeability_evaluation() -> None:
     dialog.exec()
 
 
+def _with_fresh_listings(action: Callable[[], None]) -> Callable[..., None]:
+    # Decks and presets may have been edited in Anki's own UI since the last
+    # action, so a cached listing never outlives one menu action.
+    def _run(*_args: Any) -> None:
+        _invalidate_listing_cache()
+        action()
+
+    return _run
+
+
 def init_addon() -> None:
     preset_action = QAction(_ACTION_LABEL, mw)
-    preset_action.triggered.connect(_show_preset_results)
+    preset_action.triggered.connect(_with_fresh_listings(_show_preset_results))
     mw.form.menuTools.addAction(preset_action)
 
     deck_action = QAction(_DECK_ACTION_LABEL, mw)
-    deck_action.triggered.connect(_show_deck_computed_results)
+    deck_action.triggered.connect(_with_fresh_listings(_show_deck_computed_results))
     mw.form.menuTools.addAction(deck_action)
 
     first_review_split_action = QAction(_FIRST_REVIEW_SPLIT_LABEL, mw)
-    first_review_split_action.triggered.connect(_split_deck_by_first_review)
+    first_review_split_action.triggered.connect(_with_fresh_listings(_split_deck_by_first_review))
     mw.form.menuTools.addAction(first_review_split_action)
 
     first_review_unsplit_action = QAction(_FIRST_REVIEW_UNSPLIT_LABEL, mw)
-    first_review_unsplit_action.triggered.connect(_merge_back_first_review_split)
+    first_review_unsplit_action.triggered.connect(_with_fresh_listings(_merge_back_first_review_split))
     mw.form.menuTools.addAction(first_review_unsplit_action)
 
     cleanup_presets_action = QAction(_CLEAN_EMPTY_PRESETS_LABEL, mw)
-    cleanup_presets_action.triggered.connect(_cleanup_empty_advisor_presets)
+    cleanup_presets_action.triggered.connect(_with_fresh_listings(_cleanup_empty_advisor_presets))
     mw.form.menuTools.addAction(cleanup_presets_action)
 
     evaluate_action = QAction(_EVALUATE_MERGEABILITY_LABEL, mw)
-    evaluate_action.triggered.connect(_show_mergeability_evaluation)
+    evaluate_action.triggered.connect(_with_fresh_listings(_show_mergeability_evaluation))
     mw.form.menuTools.addAction(evaluate_action)
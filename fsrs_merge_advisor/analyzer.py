@@ -1,24 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import math
-from typing import Any, Mapping, Sequence
+import sys
+from typing import Any, Iterator, Mapping, Sequence
 
-from .distance import get_validated_fsrs6_inverse_covariance, mahalanobis_distance
+from .distance import get_validated_fsrs6_whitening_matrix, pairwise_whitened_distances
 from .reference_covariance import (
     FSRS6_RECENCY_DIM,
     FSRS6_RECENCY_MAHALANOBIS_SHARED_PRESET_THRESHOLD,
 )
+from .tools.fields import field as _field
 
 _LOG_FIRST_PARAM_COUNT = 4
+_FSRS_WEIGHT_KEYS = (
+    "fsrsParams6",
+    "fsrs_params6",
+    "fsrsParams5",
+    "fsrs_params5",
+    "fsrsParams",
+    "fsrs_params",
+    "fsrsWeights",
+    "fsrs_weights",
+)
+_FSRS_NESTED_WEIGHT_KEYS = ("weights", "params", "parameters")
+# Sequences that must not be mistaken for parameter lists.
+_STRLIKE = (str, bytes, bytearray)
 NOT_FSRS6_VALID_PARAMS_MESSAGE = "Not FSRS6 valid params"
+# dataclass(slots=...) needs Python 3.10; older Anki builds bundle 3.9.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FSRSProfile:
     profile_id: int
     profile_name: str
     weights: tuple[float, ...]
+    # Distance-space vector, filled only by build(); None means compute on demand.
+    transformed_weights: tuple[float, ...] | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    @classmethod
+    def build(cls, profile_id: int, profile_name: str, weights: tuple[float, ...]) -> FSRSProfile:
+        transformed: tuple[float, ...] | None = None
+        if is_fsrs6_valid_params(weights):
+            try:
+                transformed = transform_params_for_distance(weights)
+            except ValueError:
+                # Left for pairwise_distance_matrix() to raise where it always has.
+                transformed = None
+        profile = cls(profile_id=profile_id, profile_name=profile_name, weights=weights)
+        # Frozen dataclass: set the derived field the way its generated __init__ would.
+        object.__setattr__(profile, "transformed_weights", transformed)
+        return profile
 
     @property
     def deck_id(self) -> int:
@@ -29,7 +65,7 @@ class FSRSProfile:
         return self.profile_name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DistanceResult:
     profile: FSRSProfile
     nearest_profile_name: str | None
@@ -44,51 +80,45 @@ class DistanceResult:
 
 def _to_float_tuple(values: Sequence[Any]) -> tuple[float, ...] | None:
     try:
-        converted = tuple(float(v) for v in values)
+        converted = tuple(map(float, values))
     except (TypeError, ValueError):
         return None
     return converted if converted else None
 
 
-def _field(obj: Any, name: str) -> Any:
-    if isinstance(obj, Mapping):
-        return obj.get(name)
-    return getattr(obj, name, None)
+def _is_param_sequence(value: Any) -> bool:
+    return isinstance(value, Sequence) and not isinstance(value, _STRLIKE)
 
 
-def _field_any(obj: Any, names: Sequence[str]) -> Any:
-    for name in names:
-        value = _field(obj, name)
-        if value is not None:
-            return value
-    return None
+def _iter_nested_candidate_sequences(fsrs_obj: Any) -> Iterator[Sequence[Any]]:
+    if fsrs_obj is None:
+        return
+    for name in _FSRS_NESTED_WEIGHT_KEYS:
+        nested = _field(fsrs_obj, name)
+        if _is_param_sequence(nested):
+            yield nested
 
 
-def _iter_candidate_sequences(config: Any) -> list[Sequence[Any]]:
-    candidates: list[Sequence[Any]] = []
+def _iter_candidate_sequences_mapping(config: Mapping[str, Any]) -> Iterator[Sequence[Any]]:
+    for name in _FSRS_WEIGHT_KEYS:
+        value = config.get(name)
+        if _is_param_sequence(value):
+            yield value
+    yield from _iter_nested_candidate_sequences(config.get("fsrs"))
 
-    for name in (
-        "fsrsParams6",
-        "fsrs_params6",
-        "fsrsParams5",
-        "fsrs_params5",
-        "fsrsParams",
-        "fsrs_params",
-        "fsrsWeights",
-        "fsrs_weights",
-    ):
-        value = _field(config, name)
-        if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
-            candidates.append(value)
 
-    fsrs_obj = _field(config, "fsrs")
-    if fsrs_obj is not None:
-        for name in ("weights", "params", "parameters"):
-            nested = _field(fsrs_obj, name)
-            if isinstance(nested, Sequence) and not isinstance(nested, (str, bytes, bytearray)):
-                candidates.append(nested)
+def _iter_candidate_sequences_object(config: Any) -> Iterator[Sequence[Any]]:
+    for name in _FSRS_WEIGHT_KEYS:
+        value = getattr(config, name, None)
+        if _is_param_sequence(value):
+            yield value
+    yield from _iter_nested_candidate_sequences(getattr(config, "fsrs", None))
 
-    return candidates
+
+def _iter_candidate_sequences(config: Any) -> Iterator[Sequence[Any]]:
+    if isinstance(config, Mapping):
+        return _iter_candidate_sequences_mapping(config)
+    return _iter_candidate_sequences_object(config)
 
 
 def transform_params_for_distance(
@@ -96,13 +126,24 @@ def transform_params_for_distance(
     *,
     log_first_count: int = _LOG_FIRST_PARAM_COUNT,
 ) -> tuple[float, ...]:
-    transformed = [float(value) for value in weights]
-    for idx in range(min(log_first_count, len(transformed))):
-        value = transformed[idx]
-        if value <= 0:
-            raise ValueError("Log transform requires strictly positive first FSRS params")
-        transformed[idx] = math.log(value)
-    return tuple(transformed)
+    return _transform_params_cached(tuple(weights), log_first_count)
+
+
+# Profiles are frozen and the same weights are transformed on every screen refresh.
+@lru_cache(maxsize=2048)
+def _transform_params_cached(weights: tuple[float, ...], log_first_count: int) -> tuple[float, ...]:
+    converted = tuple(map(float, weights))
+    split = max(log_first_count, 0)
+    head = converted[:split]
+    if any(value <= 0 for value in head):
+        raise ValueError("Log transform requires strictly positive first FSRS params")
+    return tuple(map(math.log, head)) + converted[split:]
+
+
+def _distance_vector(profile: FSRSProfile) -> tuple[float, ...]:
+    if profile.transformed_weights is not None:
+        return profile.transformed_weights
+    return transform_params_for_distance(profile.weights)
 
 
 def is_fsrs6_valid_params(weights: Sequence[float]) -> bool:
@@ -133,98 +174,107 @@ def extract_fsrs_weights(config: Any) -> tuple[float, ...] | None:
     return None
 
 
-def analyze_profiles(profiles: Sequence[FSRSProfile]) -> list[DistanceResult]:
+def sort_profiles_by_name(profiles: Sequence[FSRSProfile]) -> list[FSRSProfile]:
+    """The order pairwise_distance_matrix() expects for ``presorted=True``."""
+    return sorted(profiles, key=lambda profile: profile.profile_name.lower())
+
+
+def _partition_valid(profiles: Sequence[FSRSProfile]) -> tuple[list[int], list[int]]:
+    valid: list[int] = []
+    invalid: list[int] = []
+    for idx, profile in enumerate(profiles):
+        (valid if is_fsrs6_valid_params(profile.weights) else invalid).append(idx)
+    return valid, invalid
+
+
+def analyze_profiles(
+    profiles: Sequence[FSRSProfile],
+    *,
+    distance_matrix: tuple[Sequence[FSRSProfile], Sequence[Sequence[float | None]]] | None = None,
+) -> list[DistanceResult]:
+    """Pass ``distance_matrix`` (from pairwise_distance_matrix) to reuse its distances."""
     if not profiles:
         return []
 
-    results: list[DistanceResult] = []
-    valid_profiles = [profile for profile in profiles if is_fsrs6_valid_params(profile.weights)]
-    invalid_profiles = [profile for profile in profiles if not is_fsrs6_valid_params(profile.weights)]
-
-    for profile in invalid_profiles:
-        results.append(
-            DistanceResult(
-                profile=profile,
-                nearest_profile_name=None,
-                nearest_distance=None,
-                should_share_preset=None,
-                status_message=NOT_FSRS6_VALID_PARAMS_MESSAGE,
-            )
+    ordered_profiles, matrix = (
+        distance_matrix if distance_matrix is not None else pairwise_distance_matrix(profiles)
+    )
+    valid_indexes, invalid_indexes = _partition_valid(ordered_profiles)
+    results: list[DistanceResult] = [
+        DistanceResult(
+            profile=ordered_profiles[idx],
+            nearest_profile_name=None,
+            nearest_distance=None,
+            should_share_preset=None,
+            status_message=NOT_FSRS6_VALID_PARAMS_MESSAGE,
         )
+        for idx in invalid_indexes
+    ]
+
+    for idx in valid_indexes:
+        profile = ordered_profiles[idx]
+        row = matrix[idx]
+        nearest_idx: int | None = None
+        nearest_distance: float | None = None
+        # Only FSRS6-valid columns carry distances.
+        for other_idx in valid_indexes:
+            dist = row[other_idx]
+            if other_idx == idx or dist is None:
+                continue
+            if nearest_distance is None or dist < nearest_distance:
+                nearest_distance = dist
+                nearest_idx = other_idx
 
-    if len(valid_profiles) == 1:
-        only = valid_profiles[0]
         results.append(
             DistanceResult(
-                profile=only,
-                nearest_profile_name=None,
-                nearest_distance=None,
-                should_share_preset=None,
-            )
-        )
-    elif len(valid_profiles) > 1:
-        vectors = [list(transform_params_for_distance(p.weights)) for p in valid_profiles]
-        inv_cov = get_validated_fsrs6_inverse_covariance(vectors)
-
-        for idx, profile in enumerate(valid_profiles):
-            nearest_name: str | None = None
-            nearest_distance: float | None = None
-
-            for other_idx, other in enumerate(valid_profiles):
-                if idx == other_idx:
-                    continue
-
-                dist = mahalanobis_distance(vectors[idx], vectors[other_idx], inv_cov)
-                if nearest_distance is None or dist < nearest_distance:
-                    nearest_distance = dist
-                    nearest_name = other.profile_name
-
-            results.append(
-                DistanceResult(
-                    profile=profile,
-                    nearest_profile_name=nearest_name,
+                profile=profile,
+                nearest_profile_name=(
+                    None if nearest_idx is None else ordered_profiles[nearest_idx].profile_name
+                ),
+                nearest_distance=nearest_distance,
+                should_share_preset=recommend_shared_preset(
+                    parameter_count=len(profile.weights),
                     nearest_distance=nearest_distance,
-                    should_share_preset=recommend_shared_preset(
-                        parameter_count=len(profile.weights),
-                        nearest_distance=nearest_distance,
-                    ),
-                )
+                ),
             )
+        )
 
-    return sorted(results, key=lambda result: result.profile.profile_name.lower())
+    # Invalid profiles sort ahead of valid ones that share a name.
+    return sorted(
+        results,
+        key=lambda result: (result.profile.profile_name.lower(), result.status_message is None),
+    )
 
 
 def pairwise_distance_matrix(
     profiles: Sequence[FSRSProfile],
+    *,
+    presorted: bool = False,
 ) -> tuple[list[FSRSProfile], list[list[float | None]]]:
-    sorted_profiles = sorted(profiles, key=lambda profile: profile.profile_name.lower())
+    """Set ``presorted`` when ``profiles`` came from sort_profiles_by_name()."""
+    sorted_profiles = (
+        list(profiles)
+        if presorted
+        else sort_profiles_by_name(profiles)
+    )
     if not sorted_profiles:
         return [], []
 
-    matrix: list[list[float | None]] = [
-        [None for _ in range(len(sorted_profiles))] for _ in range(len(sorted_profiles))
-    ]
-    valid_indexes = [
-        idx for idx, profile in enumerate(sorted_profiles) if is_fsrs6_valid_params(profile.weights)
-    ]
+    count = len(sorted_profiles)
+    matrix: list[list[float | None]] = [[None] * count for _ in range(count)]
+    valid_indexes, _ = _partition_valid(sorted_profiles)
 
     for idx in valid_indexes:
         matrix[idx][idx] = 0.0
 
     if len(valid_indexes) >= 2:
-        vectors = [
-            list(transform_params_for_distance(sorted_profiles[idx].weights))
-            for idx in valid_indexes
-        ]
-        inv_cov = get_validated_fsrs6_inverse_covariance(vectors)
-
-        for left_offset, left_idx in enumerate(valid_indexes):
-            for right_offset, right_idx in enumerate(valid_indexes):
-                if right_offset <= left_offset:
-                    continue
-
-                dist = mahalanobis_distance(vectors[left_offset], vectors[right_offset], inv_cov)
-                matrix[left_idx][right_idx] = dist
-                matrix[right_idx][left_idx] = dist
+        vectors = [_distance_vector(sorted_profiles[idx]) for idx in valid_indexes]
+        whitening = get_validated_fsrs6_whitening_matrix(vectors)
+        valid_distances = pairwise_whitened_distances(vectors, whitening)
+
+        for left_idx, distances_row in zip(valid_indexes, valid_distances):
+            row = matrix[left_idx]
+            for right_idx, dist in zip(valid_indexes, distances_row):
+                row[right_idx] = dist
 
     return sorted_profiles, matrix
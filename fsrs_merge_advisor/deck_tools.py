@@ -6,6 +6,7 @@ from .tools.assignment_changes import (
 )
 from .tools.cache import can_reuse_cached_params
 from .tools.deck_scope import descendant_deck_ids, leaf_deck_entries
+from .tools.fields import field_any
 from .tools.fsrs_payload import set_fsrs_params_on_config_payload
 from .tools.grouping import (
     grouped_names_by_label,
@@ -13,17 +14,21 @@ from .tools.grouping import (
     max_pairwise_distance_for_group,
     recommended_group_preset_name,
     similar_items_below_threshold,
+    similar_items_by_row,
     similarity_groups_from_matrix,
     unique_name,
 )
+from .tools.matrix_display import distance_cell_display_text
 from .tools.progress_messages import (
     optimization_progress_message,
     preset_optimization_progress_message,
 )
+from .tools.progress_throttle import ProgressThrottle
 from .tools.relearning import count_relearning_steps_in_day
 from .tools.search_queries import build_deck_search_query, build_multi_deck_search_query
 
 __all__ = [
+    "ProgressThrottle",
     "build_deck_search_query",
     "build_multi_deck_search_query",
     "can_reuse_cached_params",
@@ -31,6 +36,8 @@ __all__ = [
     "count_relearning_steps_in_day",
     "deck_ids_grouped_by_target_preset",
     "descendant_deck_ids",
+    "distance_cell_display_text",
+    "field_any",
     "grouped_names_by_label",
     "leaf_deck_entries",
     "max_distance_to_group_for_item",
@@ -40,6 +47,7 @@ __all__ = [
     "recommended_group_preset_name",
     "set_fsrs_params_on_config_payload",
     "similar_items_below_threshold",
+    "similar_items_by_row",
     "similarity_groups_from_matrix",
     "unique_name",
 ]
@@ -1,13 +1,48 @@
 from __future__ import annotations
 
 import math
+import operator
 from typing import Sequence
 
 from .reference_covariance import FSRS6_RECENCY_DIM, FSRS6_RECENCY_INV_COVARIANCE_21
 
-def get_validated_fsrs6_inverse_covariance(
-    rows: Sequence[Sequence[float]],
-) -> list[list[float]]:
+
+def whitening_matrix(inv_covariance: Sequence[Sequence[float]]) -> list[list[float]]:
+    """Upper-triangular W with WᵀW = (M + Mᵀ) / 2, so d_M(x, y) = ‖Wx - Wy‖."""
+    dim = len(inv_covariance)
+    if any(len(row) != dim for row in inv_covariance):
+        raise ValueError("Inverse covariance matrix must be square")
+
+    # Cholesky on the symmetric part: the quadratic form only sees that part, and
+    # the shipped matrix is symmetric up to rounding noise.
+    lower = [[0.0] * dim for _ in range(dim)]
+    for col in range(dim):
+        lower_col = lower[col]
+        pivot = inv_covariance[col][col] - sum(
+            value * value for value in lower_col[:col]
+        )
+        if pivot <= 0.0:
+            raise ValueError("Inverse covariance matrix is not positive definite")
+        diagonal = math.sqrt(pivot)
+        lower_col[col] = diagonal
+        for row in range(col + 1, dim):
+            symmetric = (inv_covariance[row][col] + inv_covariance[col][row]) / 2
+            lower[row][col] = (
+                symmetric - sum(map(operator.mul, lower[row][:col], lower_col[:col]))
+            ) / diagonal
+    return [[lower[row][col] for row in range(dim)] for col in range(dim)]
+
+
+# Immutable rows, so callers can share these matrices without copying them.
+_FSRS6_RECENCY_INV_COVARIANCE_21: tuple[tuple[float, ...], ...] = tuple(
+    map(tuple, FSRS6_RECENCY_INV_COVARIANCE_21)
+)
+_FSRS6_RECENCY_WHITENING_21: tuple[tuple[float, ...], ...] = tuple(
+    map(tuple, whitening_matrix(FSRS6_RECENCY_INV_COVARIANCE_21))
+)
+
+
+def _validate_fsrs6_rows(rows: Sequence[Sequence[float]]) -> None:
     if not rows:
         raise ValueError("Cannot compute inverse covariance of empty data")
 
@@ -18,7 +53,19 @@ def get_validated_fsrs6_inverse_covariance(
     if dim != FSRS6_RECENCY_DIM:
         raise ValueError("Not FSRS6 valid params")
 
-    return [list(row) for row in FSRS6_RECENCY_INV_COVARIANCE_21]
+
+def get_validated_fsrs6_inverse_covariance(
+    rows: Sequence[Sequence[float]],
+) -> Sequence[Sequence[float]]:
+    _validate_fsrs6_rows(rows)
+    return _FSRS6_RECENCY_INV_COVARIANCE_21
+
+
+def get_validated_fsrs6_whitening_matrix(
+    rows: Sequence[Sequence[float]],
+) -> Sequence[Sequence[float]]:
+    _validate_fsrs6_rows(rows)
+    return _FSRS6_RECENCY_WHITENING_21
 
 
 def mahalanobis_distance(
@@ -30,10 +77,40 @@ def mahalanobis_distance(
         raise ValueError("Input vectors must have the same length")
 
     dim = len(left)
-    if any(len(row) != dim for row in inv_covariance):
+    if len(inv_covariance) != dim or any(len(row) != dim for row in inv_covariance):
         raise ValueError("Inverse covariance matrix shape does not match vector size")
 
-    delta = [left[i] - right[i] for i in range(dim)]
-    transformed = [sum(inv_covariance[i][j] * delta[j] for j in range(dim)) for i in range(dim)]
-    squared = sum(delta[i] * transformed[i] for i in range(dim))
+    delta = list(map(operator.sub, left, right))
+    squared = sum(
+        component * sum(map(operator.mul, row, delta))
+        for component, row in zip(delta, inv_covariance)
+    )
     return math.sqrt(max(squared, 0.0))
+
+
+def pairwise_whitened_distances(
+    vectors: Sequence[Sequence[float]],
+    whitening: Sequence[Sequence[float]],
+) -> list[list[float]]:
+    """Map each vector through whitening_matrix() once; pairs are then plain Euclidean."""
+    if not vectors:
+        return []
+
+    dim = len(vectors[0])
+    if any(len(vector) != dim for vector in vectors):
+        raise ValueError("All vectors must have the same length")
+    if len(whitening) != dim or any(len(row) != dim for row in whitening):
+        raise ValueError("Whitening matrix shape does not match vector size")
+
+    whitened = [[sum(map(operator.mul, row, vector)) for row in whitening] for vector in vectors]
+
+    count = len(vectors)
+    matrix = [[0.0] * count for _ in range(count)]
+    for left in range(count):
+        left_whitened = whitened[left]
+        left_row = matrix[left]
+        for right in range(left + 1, count):
+            dist = math.dist(left_whitened, whitened[right])
+            left_row[right] = dist
+            matrix[right][left] = dist
+    return matrix
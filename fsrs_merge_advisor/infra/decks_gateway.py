@@ -1,10 +1,35 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+import copy
 from typing import Any
 
 from aqt import mw
 
+from ..tools.fields import field, field_any
+
+_CONFIG_GETTER_NAMES = ("get_config", "get_config_dict", "dconf_for_update_dict", "getconf")
+_ALL_CONFIGS_GETTER_NAMES = (
+    "all_config",
+    "all_configs",
+    "all_config_dict",
+    "all_config_dicts",
+    "all_confs",
+)
+
+# Config getter names in lookup order; the last one that worked is moved to the
+# front. Names (not bound methods) so a profile switch picks up the new collection.
+_config_getter_order: list[str] = list(_CONFIG_GETTER_NAMES)
+# Deck/preset listings keyed by (collection identity, collection modification time).
+# col.mod is not bumped reliably on every write (millisecond resolution, and older
+# Anki builds only refresh it on save), so every add-on write helper also calls
+# invalidate_listing_cache(), and each menu action starts from an empty cache.
+_listing_cache: dict[str, tuple[tuple[int, int], list[Any]]] = {}
+# Resolved deck-manager attributes (None when missing), tagged with the manager
+# they were read from. Entries hold that manager alive, so the cache is emptied
+# with the listing cache and as soon as another manager is seen.
+_deck_method_cache: dict[str, tuple[Any, Any]] = {}
+
 
 def as_int(value: Any) -> int | None:
     if isinstance(value, int):
@@ -14,26 +39,45 @@ def as_int(value: Any) -> int | None:
     return None
 
 
-def field(obj: Any, name: str) -> Any:
-    if isinstance(obj, Mapping):
-        return obj.get(name)
-    return getattr(obj, name, None)
+def config_name(conf_id: int, config: Any) -> str:
+    name = field(config, "name")
+    return str(name) if isinstance(name, str) and name else f"Preset {conf_id}"
 
 
-def field_any(obj: Any, names: Sequence[str]) -> Any:
-    for name in names:
-        value = field(obj, name)
-        if value is not None:
-            return value
-    return None
+def _collection_cache_key() -> tuple[int, int] | None:
+    col = getattr(mw, "col", None)
+    mod = as_int(getattr(col, "mod", None))
+    if col is None or mod is None:
+        return None
+    return id(col), mod
 
 
-def config_name(conf_id: int, config: Any) -> str:
-    name = field(config, "name")
-    return str(name) if isinstance(name, str) and name else f"Preset {conf_id}"
+def invalidate_listing_cache() -> None:
+    _listing_cache.clear()
+    _deck_method_cache.clear()
+
+
+def _cached_listing(
+    kind: str,
+    load: Callable[[], list[Any]],
+    copy_result: Callable[[list[Any]], list[Any]] = list,
+) -> list[Any]:
+    key = _collection_cache_key()
+    if key is None:
+        return load()
+    cached = _listing_cache.get(kind)
+    if cached is not None and cached[0] == key:
+        return copy_result(cached[1])
+    result = load()
+    _listing_cache[kind] = (key, result)
+    return copy_result(result)
 
 
 def deck_entries() -> list[tuple[int, str]]:
+    return _cached_listing("deck_entries", _load_deck_entries)
+
+
+def _load_deck_entries() -> list[tuple[int, str]]:
     entries = []
     for item in mw.col.decks.all_names_and_ids():
         if isinstance(item, Mapping):
@@ -46,10 +90,22 @@ def deck_entries() -> list[tuple[int, str]]:
     return entries
 
 
+def _deck_method(decks: Any, name: str) -> Any:
+    cached = _deck_method_cache.get(name)
+    if cached is not None:
+        if cached[0] is decks:
+            return cached[1]
+        # A new collection: drop every entry bound to the old manager.
+        _deck_method_cache.clear()
+    method = getattr(decks, name, None)
+    _deck_method_cache[name] = (decks, method)
+    return method
+
+
 def config_from_conf_id(conf_id: int) -> Any:
-    getter_names = ["get_config", "get_config_dict", "dconf_for_update_dict", "getconf"]
-    for getter_name in getter_names:
-        getter = getattr(mw.col.decks, getter_name, None)
+    decks = mw.col.decks
+    for getter_name in list(_config_getter_order):
+        getter = _deck_method(decks, getter_name)
         if getter is None:
             continue
         try:
@@ -57,12 +113,16 @@ def config_from_conf_id(conf_id: int) -> Any:
         except Exception:
             continue
         if value is not None:
+            if _config_getter_order[0] != getter_name:
+                _config_getter_order.remove(getter_name)
+                _config_getter_order.insert(0, getter_name)
             return value
     return None
 
 
 def config_for_deck(deck_id: int) -> Any:
-    by_deck = getattr(mw.col.decks, "config_dict_for_deck_id", None)
+    decks = mw.col.decks
+    by_deck = _deck_method(decks, "config_dict_for_deck_id")
     if by_deck is not None:
         try:
             value = by_deck(deck_id)
@@ -71,7 +131,7 @@ def config_for_deck(deck_id: int) -> Any:
         except Exception:
             pass
 
-    deck = mw.col.decks.get(deck_id)
+    deck = decks.get(deck_id)
     conf_id = field_any(deck, ("conf", "config_id"))
     if isinstance(conf_id, int):
         return config_from_conf_id(conf_id)
@@ -89,45 +149,51 @@ def _normalize_config(config: Any, fallback_id: Any = None) -> tuple[int, str, A
     return conf_id, conf_name, config
 
 
+def _collect_configs_from_getter(getter_name: str, seen: dict[int, tuple[str, Any]]) -> None:
+    getter = _deck_method(mw.col.decks, getter_name)
+    if getter is None:
+        return
+    try:
+        raw = getter()
+    except Exception:
+        return
+
+    if isinstance(raw, Mapping):
+        entries = list(raw.items())
+    elif isinstance(raw, Sequence) and not isinstance(raw, (str, bytes, bytearray)):
+        entries = [(None, config) for config in raw]
+    else:
+        return
+
+    for key, config in entries:
+        normalized = _normalize_config(config, fallback_id=key)
+        if normalized is None:
+            continue
+        conf_id, conf_name, conf_obj = normalized
+        seen[conf_id] = (conf_name, conf_obj)
+
+
 def all_preset_configs() -> list[tuple[int, str, Any]]:
-    seen: dict[int, tuple[str, Any]] = {}
+    # Config objects are mutable and callers edit them before update_config(), so
+    # every caller gets its own copy rather than the cached instances.
+    return _cached_listing("all_preset_configs", _load_all_preset_configs, copy.deepcopy)
 
-    getter_names = (
-        "all_config",
-        "all_configs",
-        "all_config_dict",
-        "all_config_dicts",
-        "all_confs",
-    )
-    for getter_name in getter_names:
-        getter = getattr(mw.col.decks, getter_name, None)
-        if getter is None:
-            continue
-        try:
-            raw = getter()
-        except Exception:
-            continue
 
-        if isinstance(raw, Mapping):
-            entries = list(raw.items())
-        elif isinstance(raw, Sequence) and not isinstance(raw, (str, bytes, bytearray)):
-            entries = [(None, config) for config in raw]
-        else:
-            continue
+def _load_all_preset_configs() -> list[tuple[int, str, Any]]:
+    seen: dict[int, tuple[str, Any]] = {}
 
-        for key, config in entries:
-            normalized = _normalize_config(config, fallback_id=key)
-            if normalized is None:
-                continue
-            conf_id, conf_name, conf_obj = normalized
-            seen[conf_id] = (conf_name, conf_obj)
+    # Take the union of every listing getter rather than stopping at the first
+    # one that answers; the whole result is cached by all_preset_configs().
+    for getter_name in _ALL_CONFIGS_GETTER_NAMES:
+        _collect_configs_from_getter(getter_name, seen)
 
     if seen:
         return sorted((conf_id, item[0], item[1]) for conf_id, item in seen.items())
 
     # Fallback for older API shapes: gather presets referenced by decks.
-    for deck_id, _ in deck_entries():
-        deck = mw.col.decks.get(deck_id)
+    decks = mw.col.decks
+    for deck_id, _ in _load_deck_entries():
+        deck = decks.get(deck_id)
         conf_id = as_int(field_any(deck, ("conf", "config_id")))
         if conf_id is None:
             continue
@@ -145,9 +211,10 @@ def all_preset_configs() -> list[tuple[int, str, Any]]:
 
 def current_preset_assignments(deck_ids: Sequence[int]) -> dict[int, int]:
     assignments: dict[int, int] = {}
+    decks = mw.col.decks
     for deck_id in deck_ids:
         try:
-            deck = mw.col.decks.get(deck_id)
+            deck = decks.get(deck_id)
         except Exception:
             continue
         conf_id = as_int(field_any(deck, ("conf", "config_id")))
@@ -159,10 +226,11 @@ def current_preset_assignments(deck_ids: Sequence[int]) -> dict[int, int]:
 def apply_preset_assignments(assignments: Mapping[int, int]) -> tuple[int, int]:
     changed = 0
     failed = 0
-    setter = getattr(mw.col.decks, "set_config_id_for_deck_dict", None)
+    decks = mw.col.decks
+    setter = getattr(decks, "set_config_id_for_deck_dict", None)
     for deck_id, preset_id in assignments.items():
         try:
-            deck = mw.col.decks.get(deck_id)
+            deck = decks.get(deck_id)
             if not deck:
                 failed += 1
                 continue
@@ -178,11 +246,12 @@ def apply_preset_assignments(assignments: Mapping[int, int]) -> tuple[int, int]:
                     deck["conf"] = preset_id
                 else:
                     setattr(deck, "conf", preset_id)
-                mw.col.decks.save(deck)
+                decks.save(deck)
             changed += 1
         except Exception:
             failed += 1
 
+    invalidate_listing_cache()
     try:
         mw.reset()
     except Exception:
@@ -6,9 +6,17 @@ from collections.abc import Sequence
 def leaf_deck_entries(entries: Sequence[tuple[int, str]]) -> list[tuple[int, str]]:
     ancestor_names: set[str] = set()
     for _, name in entries:
-        parts = name.split("::")
-        for idx in range(1, len(parts)):
-            ancestor_names.add("::".join(parts[:idx]))
+        separators: list[int] = []
+        pos = name.find("::")
+        while pos != -1:
+            separators.append(pos)
+            pos = name.find("::", pos + 2)
+        # Longest prefix first: once one is known, all shorter ones were added with it.
+        for end in reversed(separators):
+            ancestor = name[:end]
+            if ancestor in ancestor_names:
+                break
+            ancestor_names.add(ancestor)
     return [(deck_id, name) for deck_id, name in entries if name not in ancestor_names]
 
 
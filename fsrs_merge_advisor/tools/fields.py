@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+_mapping_type_cache: dict[type, bool] = {}
+
+
+def _is_mapping_type(obj: Any) -> bool:
+    # Mapping is an ABC, so isinstance() is comparatively slow; config and deck
+    # objects only come in a handful of types, so remember the answer per type.
+    obj_type = type(obj)
+    is_mapping = _mapping_type_cache.get(obj_type)
+    if is_mapping is None:
+        is_mapping = isinstance(obj, Mapping)
+        _mapping_type_cache[obj_type] = is_mapping
+    return is_mapping
+
+
+def field_resolver(obj: Any) -> Callable[[str], Any]:
+    if _is_mapping_type(obj):
+        return obj.get
+    return lambda name: getattr(obj, name, None)
+
+
+def field(obj: Any, name: str) -> Any:
+    if _is_mapping_type(obj):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def field_any(obj: Any, names: Sequence[str]) -> Any:
+    get = field_resolver(obj)
+    for name in names:
+        value = get(name)
+        if value is not None:
+            return value
+    return None
@@ -10,16 +10,42 @@ def similar_items_below_threshold(
     self_index: int,
     threshold: float,
 ) -> list[str]:
-    pairs: list[tuple[str, float]] = []
-    for idx, value in enumerate(distances_row):
-        if idx == self_index or value is None:
-            continue
-        if value < threshold:
-            pairs.append((names[idx], value))
+    pairs = [
+        (names[idx], value)
+        for idx, value in enumerate(distances_row)
+        if value is not None and value < threshold and idx != self_index
+    ]
+    return _format_similar_pairs(pairs)
+
+
+def _format_similar_pairs(pairs: list[tuple[str, float]]) -> list[str]:
     pairs.sort(key=lambda item: (item[1], item[0].lower()))
     return [f"{name} ({distance:.4f})" for name, distance in pairs]
 
 
+def similar_items_by_row(
+    *,
+    names: Sequence[str],
+    distances: Sequence[Sequence[float | None]],
+    threshold: float,
+) -> list[list[str]]:
+    """Same as similar_items_below_threshold per row, for a symmetric matrix."""
+    total = len(names)
+    pairs_by_row: list[list[tuple[str, float]]] = [[] for _ in range(total)]
+    for left in range(total):
+        row = distances[left]
+        left_pairs = pairs_by_row[left]
+        left_name = names[left]
+        for right in range(left + 1, total):
+            value = row[right]
+            if value is None or not value < threshold:
+                continue
+            left_pairs.append((names[right], value))
+            pairs_by_row[right].append((left_name, value))
+
+    return [_format_similar_pairs(pairs) for pairs in pairs_by_row]
+
+
 def similarity_groups_from_matrix(
     *,
     names: Sequence[str],
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+NOT_FSRS6_VALID_CELL_TEXT = "Not FSRS6 valid params"
+
+
+def distance_cell_display_text(
+    value: float | None,
+    *,
+    row_valid: bool,
+    col_valid: bool,
+) -> str:
+    if not (row_valid and col_valid):
+        return NOT_FSRS6_VALID_CELL_TEXT
+    return "-" if value is None else f"{value:.4f}"
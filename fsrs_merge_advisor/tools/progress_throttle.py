@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+# Cap progress dialog refreshes at ~20/s; cached decks can finish much faster.
+PROGRESS_MIN_INTERVAL_SECONDS = 0.05
+
+
+# Updates are always let through the first time, once the work is finished, and
+# when their label names a different item than the last shown update, so a slow
+# item never runs under a stale name. Unlabelled updates are rate-limited.
+class ProgressThrottle:
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        min_interval: float = PROGRESS_MIN_INTERVAL_SECONDS,
+    ) -> None:
+        self._clock = clock
+        self._min_interval = min_interval
+        self._last_update: float | None = None
+        self._last_label: object = None
+
+    def due(self, done: int, total: int, label: object = None) -> bool:
+        now = self._clock()
+        if (
+            self._last_update is not None
+            and done < total
+            and (label is None or label == self._last_label)
+            and now - self._last_update < self._min_interval
+        ):
+            return False
+        self._last_update = now
+        if label is not None:
+            self._last_label = label
+        return True
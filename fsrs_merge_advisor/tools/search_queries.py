@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+_DECK_NAME_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def build_deck_search_query(
     *,
@@ -12,7 +14,7 @@ def build_deck_search_query(
     if not include_children:
         return f"did:{deck_id} -is:suspended"
 
-    escaped_name = deck_name.replace("\\", "\\\\").replace('"', '\\"')
+    escaped_name = deck_name.translate(_DECK_NAME_ESCAPES)
     return f'deck:"{escaped_name}" -is:suspended'
 
 
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 import sys
 from pathlib import Path
+import types
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# The Anki gateway imports aqt.mw at module load; outside Anki, tests swap in a
+# fake mw per test.
+if find_spec("aqt") is None:
+    _aqt_stub = types.ModuleType("aqt")
+    _aqt_stub.mw = None
+    sys.modules["aqt"] = _aqt_stub
@@ -9,6 +9,7 @@ from fsrs_merge_advisor.analyzer import (
     is_fsrs6_valid_params,
     pairwise_distance_matrix,
     recommend_shared_preset,
+    sort_profiles_by_name,
     transform_params_for_distance,
 )
 
@@ -96,6 +97,35 @@ def test_analyze_profiles_returns_nearest_deck_name():
     assert by_name["C"].nearest_profile_name in {"A", "B"}
 
 
+def test_analyze_profiles_reuses_precomputed_distance_matrix():
+    profiles = [
+        FSRSProfile(profile_id=1, profile_name="B", weights=tuple([1.1] * 21)),
+        FSRSProfile(profile_id=2, profile_name="A", weights=tuple([1.0] * 21)),
+        FSRSProfile(profile_id=3, profile_name="C", weights=(1.0, 2.0)),
+    ]
+    ordered, matrix = pairwise_distance_matrix(profiles)
+
+    reused = analyze_profiles(profiles, distance_matrix=(ordered, matrix))
+
+    assert reused == analyze_profiles(profiles)
+    assert [res.profile.profile_name for res in reused] == ["A", "B", "C"]
+    assert reused[0].nearest_distance == matrix[0][1]
+
+
+def test_fsrs_profile_build_precomputes_distance_vector():
+    weights = tuple([1.0] * 21)
+    built = FSRSProfile.build(profile_id=1, profile_name="A", weights=weights)
+    plain = FSRSProfile(profile_id=1, profile_name="A", weights=weights)
+
+    assert built.transformed_weights == transform_params_for_distance(weights)
+    assert built == plain
+    assert FSRSProfile.build(profile_id=2, profile_name="B", weights=(1.0, 2.0)).transformed_weights is None
+    assert plain.transformed_weights is None
+    assert pairwise_distance_matrix([built, plain]) == pairwise_distance_matrix([plain, plain])
+    with pytest.raises(TypeError):
+        FSRSProfile(profile_id=3, profile_name="C", weights=weights, transformed_weights=weights)
+
+
 def test_analyze_profiles_handles_single_profile_group():
     profiles = [
         FSRSProfile(profile_id=1, profile_name="A", weights=(1.0, 2.0)),
@@ -153,6 +183,20 @@ def test_pairwise_distance_matrix_cross_dimension_is_none():
     assert matrix[1][2] is None
 
 
+def test_pairwise_distance_matrix_presorted_keeps_given_order():
+    profiles = [
+        FSRSProfile(profile_id=2, profile_name="B", weights=tuple([1.1] * 21)),
+        FSRSProfile(profile_id=1, profile_name="a", weights=tuple([1.0] * 21)),
+    ]
+
+    kept, _ = pairwise_distance_matrix(profiles, presorted=True)
+    resorted, _ = pairwise_distance_matrix(profiles)
+
+    assert [profile.profile_name for profile in kept] == ["B", "a"]
+    assert [profile.profile_name for profile in resorted] == ["a", "B"]
+    assert resorted == sort_profiles_by_name(profiles)
+
+
 def test_is_fsrs6_valid_params():
     assert is_fsrs6_valid_params((1.0,) * 21) is True
     assert is_fsrs6_valid_params((1.0,) * 20) is False
@@ -1,4 +1,5 @@
 from fsrs_merge_advisor.deck_tools import (
+    ProgressThrottle,
     build_deck_search_query,
     build_multi_deck_search_query,
     can_reuse_cached_params,
@@ -6,6 +7,8 @@ from fsrs_merge_advisor.deck_tools import (
     count_relearning_steps_in_day,
     deck_ids_grouped_by_target_preset,
     descendant_deck_ids,
+    distance_cell_display_text,
+    field_any,
     grouped_names_by_label,
     leaf_deck_entries,
     max_distance_to_group_for_item,
@@ -15,6 +18,7 @@ from fsrs_merge_advisor.deck_tools import (
     recommended_group_preset_name,
     set_fsrs_params_on_config_payload,
     similar_items_below_threshold,
+    similar_items_by_row,
     similarity_groups_from_matrix,
     unique_name,
 )
@@ -90,6 +94,19 @@ def test_descendant_deck_ids_includes_root_and_children():
     assert descendant_deck_ids(entries, "Missing") == []
 
 
+def test_distance_cell_display_text_formats_value_and_marks_invalid_pairs():
+    assert distance_cell_display_text(1.23456, row_valid=True, col_valid=True) == "1.2346"
+    assert distance_cell_display_text(None, row_valid=True, col_valid=True) == "-"
+    assert (
+        distance_cell_display_text(1.0, row_valid=True, col_valid=False)
+        == "Not FSRS6 valid params"
+    )
+    assert (
+        distance_cell_display_text(None, row_valid=False, col_valid=True)
+        == "Not FSRS6 valid params"
+    )
+
+
 def test_optimization_progress_message_with_deck_name():
     assert optimization_progress_message(done=3, total=10, deck_name="Vocabulary") == (
         'Optimizing "Vocabulary"\nCompleted: 3/10\nRemaining: 7'
@@ -114,6 +131,48 @@ def test_preset_optimization_progress_message_without_preset_name():
     )
 
 
+def _throttle_with_clock(times: list[float]) -> ProgressThrottle:
+    ticks = iter(times)
+    return ProgressThrottle(clock=lambda: next(ticks), min_interval=0.05)
+
+
+def test_progress_throttle_drops_fast_unlabelled_updates():
+    throttle = _throttle_with_clock([0.0, 0.01, 0.02, 0.06])
+    assert throttle.due(0, 10) is True
+    assert throttle.due(1, 10) is False
+    assert throttle.due(2, 10) is False
+    assert throttle.due(3, 10) is True
+
+
+def test_progress_throttle_lets_new_label_through():
+    throttle = _throttle_with_clock([0.0, 0.01, 0.02, 0.03])
+    assert throttle.due(0, 10, None) is True
+    assert throttle.due(0, 10, "Deck A") is True
+    assert throttle.due(1, 10, "Deck A") is False
+    assert throttle.due(1, 10, "Deck B") is True
+
+
+def test_progress_throttle_always_shows_completion():
+    throttle = _throttle_with_clock([0.0, 0.01])
+    assert throttle.due(0, 2) is True
+    assert throttle.due(2, 2) is True
+
+
+def test_progress_throttle_drops_cached_deck_updates_in_the_deck_loop():
+    # Mirrors _load_computed_deck_profiles(): a distinct deck name per step, with
+    # the UI passing no label for decks served from the params cache.
+    total = 300
+    throttle = _throttle_with_clock([0.0] * (total + 2))
+    shown = [throttle.due(0, total, None)]
+    for done in range(total):
+        cached = done != 150
+        shown.append(throttle.due(done, total, None if cached else f"Deck {done}"))
+    shown.append(throttle.due(total, total, None))
+
+    assert shown.count(True) == 3
+    assert shown[0] and shown[151] and shown[-1]
+
+
 def test_can_reuse_cached_params_requires_same_review_count_and_params():
     assert can_reuse_cached_params(
         cached_review_count=12,
@@ -143,6 +202,26 @@ def test_similar_items_below_threshold_filters_and_sorts():
     ) == ["B (2.5000)", "D (2.5000)"]
 
 
+def test_similar_items_by_row_matches_per_row_helper():
+    names = ["A", "B", "C", "D"]
+    distances = [
+        [0.0, 2.5, 4.2, 2.5],
+        [2.5, 0.0, None, 1.0],
+        [4.2, None, 0.0, 3.8],
+        [2.5, 1.0, 3.8, 0.0],
+    ]
+
+    assert similar_items_by_row(names=names, distances=distances, threshold=3.8) == [
+        similar_items_below_threshold(
+            names=names,
+            distances_row=distances[idx],
+            self_index=idx,
+            threshold=3.8,
+        )
+        for idx in range(len(names))
+    ]
+
+
 def test_similar_items_below_threshold_excludes_self_none_and_boundary():
     names = ["A", "B", "C"]
     row = [0.0, None, 3.8]
@@ -307,3 +386,13 @@ def test_unique_name_appends_suffix_when_needed():
     assert unique_name("Group A", []) == "Group A"
     assert unique_name("Group A", ["Group A"]) == "Group A (2)"
     assert unique_name("Group A", ["Group A", "Group A (2)"]) == "Group A (3)"
+
+
+def test_field_any_reads_mappings_and_attributes():
+    class _Deck:
+        conf = None
+        config_id = 7
+
+    assert field_any({"conf": None, "config_id": 3}, ("conf", "config_id")) == 3
+    assert field_any(_Deck(), ("conf", "config_id")) == 7
+    assert field_any(_Deck(), ("missing",)) is None
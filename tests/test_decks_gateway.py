@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import types
+
+from fsrs_merge_advisor.infra import decks_gateway
+
+
+class _FakeDecks:
+    def __init__(self) -> None:
+        self.configs = {1: {"id": 1, "name": "Default", "fsrsParams6": [0.1]}}
+        self.decks = {10: {"id": 10, "name": "Deck", "conf": 1}}
+        self.all_config_calls = 0
+
+    def all_config(self) -> list[dict]:
+        self.all_config_calls += 1
+        return [dict(config) for config in self.configs.values()]
+
+    def all_names_and_ids(self) -> list[dict]:
+        return [{"id": deck["id"], "name": deck["name"]} for deck in self.decks.values()]
+
+    def get(self, deck_id: int) -> dict | None:
+        return self.decks.get(deck_id)
+
+    def set_config_id_for_deck_dict(self, deck: dict, conf_id: int) -> None:
+        deck["conf"] = conf_id
+
+
+def _install_fake_mw(monkeypatch) -> _FakeDecks:
+    decks = _FakeDecks()
+    fake_mw = types.SimpleNamespace(
+        col=types.SimpleNamespace(decks=decks, mod=1000),
+        reset=lambda: None,
+    )
+    monkeypatch.setattr(decks_gateway, "mw", fake_mw)
+    decks_gateway.invalidate_listing_cache()
+    return decks
+
+
+def test_all_preset_configs_returns_copies_of_cached_configs(monkeypatch) -> None:
+    decks = _install_fake_mw(monkeypatch)
+
+    first = decks_gateway.all_preset_configs()
+    first[0][2]["name"] = "Edited"
+    second = decks_gateway.all_preset_configs()
+
+    assert decks.all_config_calls == 1
+    assert second[0][1] == "Default"
+    assert second[0][2]["name"] == "Default"
+
+
+def test_invalidate_listing_cache_reloads_without_mod_change(monkeypatch) -> None:
+    decks = _install_fake_mw(monkeypatch)
+
+    assert [conf_id for conf_id, _name, _cfg in decks_gateway.all_preset_configs()] == [1]
+    decks.configs[2] = {"id": 2, "name": "New"}
+    assert [conf_id for conf_id, _name, _cfg in decks_gateway.all_preset_configs()] == [1]
+
+    decks_gateway.invalidate_listing_cache()
+
+    assert [conf_id for conf_id, _name, _cfg in decks_gateway.all_preset_configs()] == [1, 2]
+
+
+def test_apply_preset_assignments_invalidates_listing_cache(monkeypatch) -> None:
+    decks = _install_fake_mw(monkeypatch)
+
+    assert decks_gateway.deck_entries() == [(10, "Deck")]
+    decks.decks[11] = {"id": 11, "name": "Other", "conf": 1}
+
+    assert decks_gateway.apply_preset_assignments({10: 2}) == (1, 0)
+    assert decks_gateway.deck_entries() == [(10, "Deck"), (11, "Other")]
+
+
+def test_all_preset_configs_unions_every_listing_getter(monkeypatch) -> None:
+    decks = _install_fake_mw(monkeypatch)
+    decks.all_configs = lambda: [{"id": 3, "name": "Only here"}]
+
+    assert [conf_id for conf_id, _name, _cfg in decks_gateway.all_preset_configs()] == [1, 3]
+    decks_gateway.invalidate_listing_cache()
+    assert [conf_id for conf_id, _name, _cfg in decks_gateway.all_preset_configs()] == [1, 3]
+
+
+def test_deck_method_cache_releases_previous_deck_manager(monkeypatch) -> None:
+    old_decks = _install_fake_mw(monkeypatch)
+    decks_gateway.all_preset_configs()
+    decks_gateway.config_for_deck(10)
+    assert any(entry[0] is old_decks for entry in decks_gateway._deck_method_cache.values())
+
+    # A new collection seen without an invalidation still evicts the old manager.
+    new_decks = _FakeDecks()
+    monkeypatch.setattr(decks_gateway.mw.col, "decks", new_decks)
+    decks_gateway.config_for_deck(10)
+    assert all(entry[0] is new_decks for entry in decks_gateway._deck_method_cache.values())
+
+    decks_gateway.invalidate_listing_cache()
+    assert not decks_gateway._deck_method_cache
@@ -2,7 +2,10 @@ import pytest
 
 from fsrs_merge_advisor.distance import (
     get_validated_fsrs6_inverse_covariance,
+    get_validated_fsrs6_whitening_matrix,
     mahalanobis_distance,
+    pairwise_whitened_distances,
+    whitening_matrix,
 )
 from fsrs_merge_advisor.reference_covariance import (
     FSRS6_RECENCY_DIM,
@@ -20,12 +23,18 @@ def test_mahalanobis_positive_with_reference_inverse_covariance():
     assert dist > 0
 
 
+def test_mahalanobis_rejects_inverse_covariance_with_missing_rows():
+    with pytest.raises(ValueError, match="shape does not match"):
+        mahalanobis_distance([1.0, 2.0], [0.0, 0.0], [[1.0, 0.0]])
+
+
 def test_get_validated_fsrs6_inverse_covariance_uses_reference_for_21_params():
     rows = [[float(i)] * FSRS6_RECENCY_DIM for i in range(1, 4)]
 
     inv_cov = get_validated_fsrs6_inverse_covariance(rows)
 
-    assert inv_cov == FSRS6_RECENCY_INV_COVARIANCE_21
+    assert [list(row) for row in inv_cov] == FSRS6_RECENCY_INV_COVARIANCE_21
+    assert inv_cov is get_validated_fsrs6_inverse_covariance(rows)
 
 
 def test_get_validated_fsrs6_inverse_covariance_rejects_non_fsrs6_dimensions():
@@ -33,3 +42,35 @@ def test_get_validated_fsrs6_inverse_covariance_rejects_non_fsrs6_dimensions():
 
     with pytest.raises(ValueError, match="Not FSRS6 valid params"):
         get_validated_fsrs6_inverse_covariance(rows)
+
+
+def test_pairwise_whitened_distances_match_mahalanobis_distances():
+    vectors = [
+        [1.0] * FSRS6_RECENCY_DIM,
+        [1.5] * FSRS6_RECENCY_DIM,
+        [float(i) / 10 for i in range(FSRS6_RECENCY_DIM)],
+    ]
+
+    whitened = pairwise_whitened_distances(vectors, get_validated_fsrs6_whitening_matrix(vectors))
+
+    for left in range(len(vectors)):
+        assert whitened[left][left] == 0.0
+        for right in range(len(vectors)):
+            assert whitened[left][right] == whitened[right][left]
+            assert whitened[left][right] == pytest.approx(
+                mahalanobis_distance(
+                    vectors[left],
+                    vectors[right],
+                    FSRS6_RECENCY_INV_COVARIANCE_21,
+                )
+            )
+
+
+def test_pairwise_whitened_distances_rejects_whitening_with_missing_rows():
+    with pytest.raises(ValueError, match="shape does not match"):
+        pairwise_whitened_distances([[1.0, 2.0], [0.0, 0.0]], [[1.0, 0.0]])
+
+
+def test_whitening_matrix_rejects_non_positive_definite_matrix():
+    with pytest.raises(ValueError, match="positive definite"):
+        whitening_matrix([[1.0, 2.0], [2.0, 1.0]])